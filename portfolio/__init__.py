@@ -0,0 +1 @@
+"""Helpers behind the portfolio landing page (Home.py)."""
@@ -0,0 +1,164 @@
+"""Page assets served by Streamlit's static file server.
+
+With ``server.enableStaticServing`` on, files under ``./static/`` are served
+at ``app/static/<name>``. ``build()`` publishes the page's images there under
+content-hashed names (every image derivative and the Lottie poster frames)
+and records them in ``static/manifest.json``::
+
+    python -m portfolio.assets
+
+Streamlit only serves image types (SERVED_TYPES) with their real content
+type; anything else goes out as ``text/plain`` with ``nosniff``, so the resume
+PDF and the animation JSON keep going through the session.
+
+``static/`` is committed: Streamlit Cloud runs Home.py straight from the
+repository with no build step, so rebuild and commit it whenever an image or
+poster changes. Entries whose source changed since are ignored until then.
+
+``url()`` resolves a source path to its published URL. The URL carries a
+``?v=<hash>`` query string, which makes Tornado's static handler answer with a
+ten-year ``Cache-Control: max-age``; since the name changes with the content,
+the browser and any proxy can keep the file for good. When there is no
+manifest, or a source changed since the last build, ``url()`` returns None and
+Home.py falls back to sending the asset through the session.
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+
+from portfolio import content, images, lottie
+
+STATIC_DIR = "./static"
+MANIFEST = os.path.join(STATIC_DIR, "manifest.json")
+URL_PREFIX = "app/static/"
+# Extensions Streamlit's static handler serves with their own content type.
+SERVED_TYPES = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+_manifests = {}
+_lock = threading.Lock()
+
+
+def image_key(path, width, density, fmt):
+    return f"{path}@{width}w@{density}x.{fmt}"
+
+
+def poster_key(path):
+    return f"{path}#poster"
+
+
+def _publish(origin, source):
+    """Copy ``source`` (built from ``origin``) into STATIC_DIR under a content-hashed name."""
+    stem, ext = os.path.splitext(os.path.basename(source))
+    if ext.lower() not in SERVED_TYPES:
+        raise ValueError(f"{source}: Streamlit serves {ext} files as text/plain")
+    published = f"{stem}.{images.content_hash(source)}{ext}"
+    target = os.path.join(STATIC_DIR, published)
+    if not os.path.exists(target):
+        shutil.copyfile(source, target)
+    return {"file": published, "origin": origin, "origin_hash": images.content_hash(origin),
+            "bytes": os.path.getsize(target)}
+
+
+def _sources():
+    """Yield (manifest key, source file, file to publish) for every page image."""
+    page = content.load()
+    for settings in page.animations.values():
+        poster = lottie.poster_path(settings["path"])
+        if poster:
+            yield poster_key(settings["path"]), settings["path"], poster
+    for path, width in page.page_images().items():
+        for density in images.DENSITIES:
+            for fmt in images.FORMATS:
+                yield image_key(path, width, density, fmt), path, images.derivative(path, width, density, fmt)
+
+
+def build():
+    """Publish every page asset, rewrite the manifest and delete stale files."""
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    previous = _read(MANIFEST) or {}
+    manifest = {key: _publish(origin, source) for key, origin, source in _sources()}
+    keep = {entry["file"] for entry in manifest.values()}
+    for entry in previous.values():
+        if entry["file"] not in keep and os.path.exists(os.path.join(STATIC_DIR, entry["file"])):
+            os.remove(os.path.join(STATIC_DIR, entry["file"]))
+    with open(MANIFEST + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(MANIFEST + ".tmp", MANIFEST)
+    return manifest
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def manifest(path=MANIFEST):
+    """Return the published manifest, re-read only when the file changes (None if missing)."""
+    try:
+        key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    with _lock:
+        if key in _manifests:
+            return _manifests[key]
+    data = _read(path)
+    with _lock:
+        _manifests.clear()
+        _manifests[key] = data
+    return data
+
+
+def enabled():
+    """Static serving is on and a manifest was built."""
+    import streamlit as st
+
+    return bool(st.get_option("server.enableStaticServing")) and manifest() is not None
+
+
+def url(key):
+    """Return the cacheable URL of an asset, or None if it is not published or is out of date.
+
+    ``key`` is ``image_key(...)`` for an image derivative, ``poster_key(...)`` for a poster.
+    """
+    entry = (manifest() or {}).get(key)
+    if entry is None or not os.path.exists(entry["origin"]):
+        return None
+    if images.content_hash(entry["origin"]) != entry["origin_hash"]:
+        return None
+    version = entry["file"].rsplit(".", 2)[-2]
+    return f"{URL_PREFIX}{entry['file']}?v={version}"
+
+
+def image_html(path, width):
+    """<picture> of the published derivatives of ``path``, or None if one is missing."""
+    if not enabled():
+        return None
+    urls = {fmt: [url(image_key(path, width, d, fmt)) for d in images.DENSITIES] for fmt in images.FORMATS}
+    if not all(all(u) for u in urls.values()):
+        return None
+    return images.picture_html(urls["webp"], urls["fallback"], width)
+
+
+def asset_url(key):
+    """Cacheable URL of a published image, or None when static serving is off."""
+    return url(key) if enabled() else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args(argv)
+    published = build()
+    total = 0
+    for key, entry in sorted(published.items()):
+        total += entry["bytes"]
+        print(f"{entry['bytes'] / 1024:9.1f} KiB  {entry['file']:<55} {key}")
+    print(f"{total / 1024:9.1f} KiB  {len(published)} files -> {STATIC_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Headless benchmark of the landing page.
+
+Runs Home.py through Streamlit's AppTest, cold (each run in a fresh
+interpreter, so every process-wide cache is empty) and warm (repeated runs in
+one process), and reports p50/p95 script time and payload size::
+
+    python -m portfolio.bench --runs 20 --cold 5 --json bench.json --max-p95-ms 500
+
+With ``--max-p95-ms`` the command exits non-zero when the warm p95 is over
+budget, so it can gate a deploy.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from portfolio import perf
+
+SCRIPT = "Home.py"
+
+
+def run_once(script=SCRIPT, timeout=60):
+    """Run the page once in a new session and return its timing and payload."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=timeout)
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(f"{script} raised: {at.exception[0].message}")
+    page = perf.records(kind="page")[-1]
+    sections = {r["name"]: r for r in perf.records(kind="section") if r["started"] >= page["started"]}
+    return {
+        "ms": elapsed,
+        "script_ms": page["ms"],
+        "bytes": page["bytes"],
+        "elements": page["elements"],
+        "sections": {
+            name: {key: r[key] for key in ("ms", "elements", "bytes", "steps")}
+            for name, r in sections.items()
+        },
+    }
+
+
+def run_cold(script=SCRIPT):
+    """Run the page once in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-m", "portfolio.bench", "--worker", "--script", script],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def summarize(runs):
+    return {
+        "runs": len(runs),
+        "script_ms_p50": percentile([r["script_ms"] for r in runs], 50),
+        "script_ms_p95": percentile([r["script_ms"] for r in runs], 95),
+        "bytes_p50": percentile([r["bytes"] for r in runs], 50),
+        "bytes_p95": percentile([r["bytes"] for r in runs], 95),
+    }
+
+
+def benchmark(runs=20, cold=5, script=SCRIPT):
+    cold_runs = [run_cold(script) for _ in range(cold)]
+    run_once(script)  # prime the process-wide caches
+    warm_runs = [run_once(script) for _ in range(runs)]
+    return {
+        "cold": summarize(cold_runs) if cold_runs else None,
+        "warm": summarize(warm_runs),
+        "warm_sections": {
+            name: percentile([r["sections"][name]["ms"] for r in warm_runs if name in r["sections"]], 50)
+            for name in warm_runs[-1]["sections"]
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="warm runs")
+    parser.add_argument("--cold", type=int, default=5, help="cold runs, one interpreter each")
+    parser.add_argument("--script", default=SCRIPT)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--max-p95-ms", type=float, help="fail when warm p95 script time is over this")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_once(args.script)))
+        return 0
+
+    report = benchmark(args.runs, args.cold, args.script)
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.max_p95_ms is not None and report["warm"]["script_ms_p95"] > args.max_p95_ms:
+        print(f"warm p95 {report['warm']['script_ms_p95']:.1f} ms is over {args.max_p95_ms} ms",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Content registry of the landing page.
+
+Everything the page shows (bio, sidebar apps, portfolio and API-explorer
+cards, work-experience entries, skills, animation settings) is described in
+``portfolio/content.json``. ``load()`` reads it once per process, again only
+when the file changes, and compiles every entry into its HTML fragment, cached
+by the entry's content hash. Home.py and the static export then only loop over
+ready-made fragments.
+"""
+import hashlib
+import json
+import os
+import threading
+from html import escape
+
+CONTENT_PATH = os.path.join(os.path.dirname(__file__), "content.json")
+
+_fragments = {}
+_registries = {}
+_lock = threading.Lock()
+
+
+def entry_hash(entry):
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def bio_html(bio):
+    return f"<p style='text-align: justify; font-size: 18px;'>{bio}</p>"
+
+
+def sidebar_group_html(group):
+    return f"<p style='text-align: left; font-size: 18px;'><u>{escape(group['group'])}:</u></p>"
+
+
+def sidebar_link_html(app):
+    return (f"<a style='text-decoration: none; color: white;' href='{app['url']}'>"
+            f"{app['icon']} {escape(app['name'])}</a>")
+
+
+def project_html(entry):
+    """Description and link of a portfolio card (the image is rendered by the caller)."""
+    link = entry["link"]
+    return (f"<p style='text-align: justify; font-size: 18px;'>{entry['description']}</p>"
+            f"<h6><a href='{link['url']}'>{link['icon']} link</a></h6>")
+
+
+def experience_html(entry):
+    """Work-experience entry: each group is an optional intro line followed by bullets,
+    a bullet being either plain text or a [name, text] pair."""
+    parts = [f"<p class='larger-text' style='text-align: justify;'>"
+             f"<b>{escape(entry['heading'])}</b> <code>{escape(entry['tag'])}</code></p>"]
+    for group in entry["groups"]:
+        if group.get("intro"):
+            parts.append(f"<p class='larger-text'>{escape(group['intro'])}</p>")
+        if group["items"]:
+            items = "".join(
+                f"<li>{escape(item[0])}<p>{escape(item[1])}</p></li>" if isinstance(item, list)
+                else f"<li>{escape(item)}</li>"
+                for item in group["items"]
+            )
+            parts.append(f"<ul class='larger-text'>{items}</ul>")
+    return "".join(parts)
+
+
+def skill_html(skill):
+    title, content = skill
+    return f"<p style='font-size: 18px;'>{escape(title)}: <code>{escape(content)}</code></p>"
+
+
+def compile_entry(entry):
+    """Return ``entry`` with its content hash (``key``) and HTML fragment (``html``)."""
+    key = entry_hash(entry)
+    with _lock:
+        html = _fragments.get(key)
+        if html is None:
+            html = experience_html(entry) if "groups" in entry else project_html(entry)
+            _fragments[key] = html
+    return dict(entry, key=key, html=html)
+
+
+class Registry:
+    """The compiled content of the page."""
+
+    def __init__(self, data):
+        self.name = data["name"]
+        self.tagline = data["tagline"]
+        self.bio_html = bio_html(data["bio"])
+        self.resume = data["resume"]
+        self.portrait = data["portrait"]
+        self.animations = data["animations"]
+        self.sidebar = [
+            {"html": sidebar_group_html(group), "links": [sidebar_link_html(app) for app in group["apps"]]}
+            for group in data["sidebar"]
+        ]
+        self.apps = [app for group in data["sidebar"] for app in group["apps"]]
+        self.entries = [compile_entry(entry) for entry in data["entries"]]
+        self.skills_html = [skill_html(skill) for skill in data["skills"]]
+
+    def page_entries(self, page):
+        """Entries shown in the ``page`` section ("Portfolio", "Work Experience"), in order."""
+        return [entry for entry in self.entries if entry["page"] == page]
+
+    def page_images(self):
+        """Return {path: displayed width} for every image on the page."""
+        images = {self.portrait["path"]: self.portrait["width"]}
+        images.update((e["image"]["path"], e["image"]["width"]) for e in self.entries if "image" in e)
+        return images
+
+
+def load(path=CONTENT_PATH):
+    """Return the compiled registry for ``path``, rebuilt only when the file changes."""
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with _lock:
+        registry = _registries.get(key)
+    if registry is None:
+        with open(path, encoding="utf-8") as f:
+            registry = Registry(json.load(f))
+        with _lock:
+            _registries.clear()
+            _registries[key] = registry
+    return registry
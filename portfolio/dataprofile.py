@@ -0,0 +1,267 @@
+"""Data-exploration profile for the clustering tool.
+
+``profile`` summarizes a DataFrame in one vectorized pass: null counts, a
+nullity matrix, per-column histograms, category frequencies and numeric
+correlations. Exact counts (rows, nulls, categories) use every row, while the
+distribution parts (histograms, correlations, nullity matrix) use a random
+sample of SAMPLE_ROWS rows once the data is larger than that. The summary
+holds only small arrays and lists and is cached per process by data hash, and
+the ``*_figure`` functions draw the missing-value, distribution and
+correlation plots from it, never from the raw rows.
+
+Profile Customers.csv and time the profile against the row count::
+
+    python -m portfolio.dataprofile --plots ./.cache/profile
+    python -m portfolio.dataprofile --benchmark 1 10 100 1000
+"""
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from portfolio.datasets import SAMPLE_PATH, data_hash
+
+SAMPLE_ROWS = 200_000
+BINS = 30
+TOP_CATEGORIES = 20
+NULL_BLOCKS = 100  # rows of the nullity matrix
+MAX_CACHED = 32
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _sample(df, rows, random_state):
+    if len(df) <= rows:
+        return df
+    index = np.sort(np.random.default_rng(random_state).choice(len(df), size=rows, replace=False))
+    return df.iloc[index]
+
+
+def _null_matrix(mask):
+    """Share of nulls per column in NULL_BLOCKS consecutive row blocks (missingno-style matrix)."""
+    if not len(mask):
+        return np.zeros((0, mask.shape[1]))
+    starts = np.unique(np.linspace(0, len(mask), min(NULL_BLOCKS, len(mask)), endpoint=False).astype(int))
+    sizes = np.diff(np.append(starts, len(mask)))
+    return np.add.reduceat(mask.astype(np.int64), starts, axis=0) / sizes[:, None]
+
+
+def _histograms(X, bins):
+    """Histograms of every column of ``X`` (NaN ignored) with a single bincount."""
+    valid = ~np.isnan(X)
+    present = valid.any(axis=0)
+    lo = np.nanmin(np.where(present, X, 0.0), axis=0)
+    hi = np.nanmax(np.where(present, X, 0.0), axis=0)
+    width = np.where(hi > lo, hi - lo, 1.0)
+    idx = np.clip(((np.where(valid, X, lo) - lo) / width * bins).astype(int), 0, bins - 1)
+    idx += np.arange(X.shape[1]) * bins
+    counts = np.bincount(idx[valid], minlength=X.shape[1] * bins).reshape(X.shape[1], bins)
+    edges = lo[:, None] + width[:, None] * np.linspace(0, 1, bins + 1)
+    return counts, edges
+
+
+def _correlation(X):
+    """Pearson correlations over the rows where both columns are present (like ``DataFrame.corr``).
+
+    Every pairwise count, sum and sum of squares comes out of a few matrix
+    products; ``[i, j]`` of ``sums`` is the sum of column i over the rows where
+    column j is present.
+    """
+    valid = ~np.isnan(X)
+    # Centring by the column means changes no correlation but keeps the sums small.
+    X0 = np.where(valid, X - np.nanmean(X, axis=0), 0.0)
+    M = valid.astype(float)
+    n = M.T @ M
+    sums = X0.T @ M
+    squares = (X0 ** 2).T @ M
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = X0.T @ X0 - sums * sums.T / n
+        var = squares - sums ** 2 / n
+        corr = cov / np.sqrt(var * var.T)
+    corr[(n < 2) | (var <= 0) | (var.T <= 0)] = np.nan
+    return np.clip(corr, -1, 1)
+
+
+def summarize(df, sample_rows=SAMPLE_ROWS, bins=BINS, top=TOP_CATEGORIES, random_state=42):
+    """Compute the profile of ``df`` (uncached, see ``profile``)."""
+    start = time.perf_counter()
+    numeric = list(df.select_dtypes("number").columns)
+    categorical = [c for c in df.columns if c not in numeric]
+    sample = _sample(df, sample_rows, random_state)
+
+    mask = sample.isna().to_numpy()
+    summary = {
+        "rows": len(df),
+        "sampled": len(sample) if len(sample) < len(df) else None,
+        "columns": list(map(str, df.columns)),
+        "nulls": dict(zip(map(str, df.columns), df.isna().sum().tolist())),
+        "null_matrix": _null_matrix(mask),
+        "numeric": {},
+        "categorical": {},
+        "correlation": None,
+    }
+
+    if numeric:
+        X = sample[numeric].to_numpy(dtype=float)
+        if len(X):
+            counts, edges = _histograms(X, bins)
+            mean, std = np.nanmean(X, axis=0), np.nanstd(X, axis=0)
+            for i, column in enumerate(map(str, numeric)):
+                summary["numeric"][column] = {
+                    "counts": counts[i], "edges": edges[i],
+                    "min": float(edges[i][0]), "max": float(edges[i][-1]),
+                    "mean": float(mean[i]), "std": float(std[i]),
+                }
+            if len(numeric) > 1:
+                summary["correlation"] = {"columns": list(map(str, numeric)), "matrix": _correlation(X)}
+
+    for column in categorical:
+        freq = df[column].value_counts(dropna=True)
+        freq = freq[freq > 0]  # unused categories of a categorical column
+        summary["categorical"][str(column)] = {
+            "values": list(map(str, freq.index[:top])),
+            "counts": freq.to_numpy()[:top],
+            "other": int(freq.to_numpy()[top:].sum()),
+            "distinct": len(freq),
+        }
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def profile(df, sample_rows=SAMPLE_ROWS, bins=BINS, top=TOP_CATEGORIES, random_state=42):
+    """Return the profile of ``df``, cached per (data hash, parameters).
+
+    Besides the summary keys, ``seconds`` is the time it took to compute and
+    ``cached`` whether it came from the cache.
+    """
+    key = (data_hash(df), sample_rows, bins, top, random_state)
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return dict(_cache[key], cached=True)
+    summary = summarize(df, sample_rows, bins, top, random_state)
+    with _lock:
+        _cache[key] = summary
+        if len(_cache) > MAX_CACHED:
+            _cache.popitem(last=False)
+    return dict(summary, cached=False)
+
+
+def _grid(n, cols=3, size=(4, 2.6)):
+    from matplotlib.figure import Figure
+
+    rows = max(1, -(-n // cols))
+    fig = Figure(figsize=(size[0] * cols, size[1] * rows), layout="constrained")
+    axes = fig.subplots(rows, cols, squeeze=False).ravel()
+    for ax in axes[n:]:
+        ax.set_visible(False)
+    return fig, axes
+
+
+def missing_figure(summary):
+    """Null counts per column and the nullity matrix, like missingno's bar and matrix plots."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(12, 5), layout="constrained")
+    bar, matrix = fig.subplots(1, 2, width_ratios=(1, 2))
+    columns = summary["columns"]
+    present = [summary["rows"] - summary["nulls"][c] for c in columns]
+    bar.barh(columns, present, color="#04AA6D")
+    bar.invert_yaxis()
+    bar.set_xlim(0, max(summary["rows"], 1))
+    bar.set_title("Non-null values")
+    matrix.imshow(1 - summary["null_matrix"], aspect="auto", cmap="Greys", vmin=0, vmax=1,
+                  interpolation="nearest")
+    matrix.set_xticks(range(len(columns)), columns, rotation=45, ha="right")
+    matrix.set_yticks([])
+    matrix.set_title("Nullity (white: missing)" + (f", {summary['sampled']} sampled rows" if summary["sampled"] else ""))
+    return fig
+
+
+def distribution_figure(summary):
+    """Histograms of the numeric columns and top frequencies of the categorical ones."""
+    numeric, categorical = summary["numeric"], summary["categorical"]
+    fig, axes = _grid(len(numeric) + len(categorical))
+    for ax, (column, hist) in zip(axes, numeric.items()):
+        ax.stairs(hist["counts"], hist["edges"], fill=True, color="#04AA6D")
+        ax.set_title(column)
+    for ax, (column, freq) in zip(axes[len(numeric):], categorical.items()):
+        values, counts = list(freq["values"]), list(freq["counts"])
+        if freq["other"]:
+            values.append("(other)")
+            counts.append(freq["other"])
+        ax.barh(values, counts, color="#04AA6D")
+        ax.invert_yaxis()
+        ax.set_title(f"{column} ({freq['distinct']} values)")
+    return fig
+
+
+def correlation_figure(summary):
+    """Heatmap of the numeric correlations, or None with fewer than two numeric columns."""
+    if summary["correlation"] is None:
+        return None
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    columns = summary["correlation"]["columns"]
+    fig = Figure(figsize=(1 + 0.8 * len(columns), 0.8 * len(columns)), layout="constrained")
+    ax = fig.subplots()
+    sns.heatmap(summary["correlation"]["matrix"], ax=ax, vmin=-1, vmax=1, center=0, cmap="vlag",
+                annot=True, fmt=".2f", xticklabels=columns, yticklabels=columns, square=True)
+    return fig
+
+
+def benchmark(scales=(1, 10, 100, 1000), random_state=42):
+    """Profile the sample dataset resampled ``scale`` times; return time against row count."""
+    from portfolio.ingest import ingest
+
+    data = ingest(SAMPLE_PATH)[0]
+    rng = np.random.default_rng(random_state)
+    report = []
+    for scale in scales:
+        big = data.iloc[rng.integers(0, len(data), size=len(data) * scale)].reset_index(drop=True)
+        cold = profile(big, random_state=random_state)
+        start = time.perf_counter()
+        profile(big, random_state=random_state)
+        warm = time.perf_counter() - start
+        report.append({
+            "rows": len(big),
+            "sampled": cold["sampled"],
+            "seconds": cold["seconds"],
+            "rows_per_sec": len(big) / cold["seconds"],
+            "cached_seconds": warm,
+        })
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile a dataset for the clustering tool.")
+    parser.add_argument("path", nargs="?", default=SAMPLE_PATH)
+    parser.add_argument("--plots", metavar="DIR", help="write the profile plots to DIR")
+    parser.add_argument("--benchmark", type=int, nargs="+", metavar="SCALE",
+                        help="time the profile on the sample resampled SCALE times")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(f"{'rows':>10}{'sampled':>10}{'profile s':>11}{'rows/s':>12}{'cached ms':>11}")
+        for row in benchmark(args.benchmark):
+            print(f"{row['rows']:>10}{row['sampled'] or '-':>10}{row['seconds']:>11.3f}"
+                  f"{row['rows_per_sec']:>12.0f}{row['cached_seconds'] * 1000:>11.2f}")
+    else:
+        from portfolio.ingest import ingest
+
+        summary = profile(ingest(args.path)[0])
+        print(f"{summary['rows']} rows profiled in {summary['seconds'] * 1000:.1f} ms")
+        for column in summary["columns"]:
+            print(f"  {column:<30}{summary['nulls'][column]:>8} nulls")
+        if args.plots:
+            os.makedirs(args.plots, exist_ok=True)
+            figures = {"missing": missing_figure(summary), "distributions": distribution_figure(summary),
+                       "correlation": correlation_figure(summary)}
+            for name, fig in figures.items():
+                if fig is not None:
+                    fig.savefig(os.path.join(args.plots, f"{name}.png"), dpi=100)
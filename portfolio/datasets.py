@@ -0,0 +1,17 @@
+"""Dataset helpers shared by the clustering and profiling tools.
+
+Kept free of the heavy libraries (scikit-learn, kneed, ...) so that either
+tool can key its cache without importing the other.
+"""
+import hashlib
+
+import pandas as pd
+
+SAMPLE_PATH = "./Customers.csv"
+
+
+def data_hash(df):
+    """Content hash of a DataFrame (values, index and column names)."""
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update("\0".join(map(str, df.columns)).encode())
+    return digest.hexdigest()
@@ -0,0 +1,185 @@
+"""Static export of the landing page.
+
+Renders the page into a self-contained bundle that any static file server can
+host: ``index.html`` plus ``assets/`` with content-hashed file names (styles,
+resume PDF, image derivatives, minified Lottie animations)::
+
+    python -m portfolio.export [--out dist] [--force]
+
+The bundle is only rebuilt when the content, the export code or an asset
+changes; the build key is stored in ``<out>/.build-key``.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from html import escape
+
+from portfolio import content, images, lottie, styles
+from portfolio.resume import RESUME_PATH
+
+OUT_DIR = "./dist"
+EXPORT_CSS = "./style/export.css"
+
+# Start every .lottie placeholder with the same settings st_lottie uses.
+LOTTIE_INIT = """
+document.addEventListener("DOMContentLoaded", function () {
+  document.querySelectorAll(".lottie").forEach(function (el) {
+    var anim = lottie.loadAnimation({
+      container: el, renderer: "svg", loop: true, autoplay: true, path: el.dataset.src
+    });
+    anim.setSpeed(parseFloat(el.dataset.speed));
+    anim.setDirection(-1);
+  });
+});
+"""
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_files():
+    """Every file the export publishes or depends on, and the code that produces them.
+
+    Animations and images are listed as the files actually published (the
+    minified copy, the derivatives), so re-minifying or changing the encoder
+    settings changes the key.
+    """
+    page = content.load()
+    files = [__file__, content.__file__, images.__file__, lottie.__file__, styles.__file__,
+             content.CONTENT_PATH, EXPORT_CSS, RESUME_PATH, *styles.STYLE_FILES]
+    files += [lottie._resolve(settings["path"]) for settings in page.animations.values()]
+    files += [images.derivative(path, width, density, fmt)
+              for path, width in page.page_images().items()
+              for density in images.DENSITIES for fmt in images.FORMATS]
+    return files
+
+
+def build_key():
+    digest = hashlib.sha256()
+    for path in source_files():
+        digest.update(path.encode())
+        digest.update(_file_hash(path).encode())
+    return digest.hexdigest()
+
+
+class _Assets:
+    """Copies files into ``<out>/assets`` under content-hashed names."""
+
+    def __init__(self, out_dir):
+        self.dir = os.path.join(out_dir, "assets")
+        os.makedirs(self.dir, exist_ok=True)
+
+    def publish(self, path, name=None):
+        stem, ext = os.path.splitext(name or os.path.basename(path))
+        published = f"{stem}.{_file_hash(path)[:12]}{ext}"
+        target = os.path.join(self.dir, published)
+        if not os.path.exists(target):
+            shutil.copyfile(path, target)
+        return f"assets/{published}"
+
+    def publish_text(self, text, name):
+        stem, ext = os.path.splitext(name)
+        published = f"{stem}.{hashlib.sha256(text.encode()).hexdigest()[:12]}{ext}"
+        with open(os.path.join(self.dir, published), "w") as f:
+            f.write(text)
+        return f"assets/{published}"
+
+
+def picture_html(assets, path, width):
+    """<picture> with WebP and PNG/JPEG sources at 1x and 2x."""
+    webp = [assets.publish(images.derivative(path, width, d, "webp")) for d in images.DENSITIES]
+    fallback = [assets.publish(images.derivative(path, width, d, "fallback")) for d in images.DENSITIES]
+    return images.picture_html(webp, fallback, width)
+
+
+def animation_html(assets, page, name):
+    settings = page.animations[name]
+    src = assets.publish(lottie._resolve(settings["path"]), os.path.basename(settings["path"]))
+    return (f"{'<br>' * settings['spacer']}"
+            f"<div class='lottie' data-src='{src}' data-speed='{settings['speed']}'"
+            f" style='height: {settings['height']}px'></div>")
+
+
+def expander_html(title, body):
+    return f"<details><summary>{escape(title)}</summary>{body}</details>"
+
+
+def section_html(left, right):
+    return f"<hr><section class='row'><div style='flex: 5'>{left}</div><div style='flex: 8'>{right}</div></section>"
+
+
+def entries_html(assets, page, name):
+    """The registry entries of a section as <details> elements, like Home.py's loop."""
+    parts, subheader = [f"<h2>{escape(name)}</h2>"], None
+    for entry in page.page_entries(name):
+        if entry.get("section") and entry["section"] != subheader:
+            subheader = entry["section"]
+            parts.append(f"<h3 class='green'>{escape(subheader)}</h3>")
+        body = entry["html"]
+        if "image" in entry:
+            body += picture_html(assets, entry["image"]["path"], entry["image"]["width"])
+        parts.append(expander_html(entry["title"], body))
+    return "".join(parts)
+
+
+def render(assets):
+    """Return index.html for the page, publishing its assets along the way."""
+    page = content.load()
+    css = assets.publish_text(styles.bundle(styles.STYLE_FILES + (EXPORT_CSS,))[0], "bundle.css")
+    resume = assets.publish(RESUME_PATH, page.resume["file_name"])
+
+    sidebar = "<h2>Projects</h2>" + "".join(group["html"] + "".join(group["links"]) for group in page.sidebar)
+    header = (
+        "<section class='row'><div style='flex: 4'>"
+        f"<h1>{escape(page.name)}</h1><h3>{escape(page.tagline)}</h3>{page.bio_html}"
+        f"<a class='button' href='{resume}' download='{page.resume['file_name']}'>{escape(page.resume['label'])}</a>"
+        "</div><div style='flex: 7'>" + "<br>" * 6
+        + picture_html(assets, page.portrait["path"], page.portrait["width"])
+        + "</div></section>"
+    )
+    skills = "<h2>IT Skills</h2>" + "".join(page.skills_html)
+
+    return (
+        "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>"
+        "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+        f"<title>{escape(page.name)} portfolio – {escape(page.tagline)}</title>"
+        f"<link rel='stylesheet' href='{css}'></head>"
+        f"<body><div class='stApp'><aside class='sidebar'>{sidebar}</aside><main>"
+        + header
+        + section_html(animation_html(assets, page, "Portfolio"), entries_html(assets, page, "Portfolio"))
+        + section_html(animation_html(assets, page, "Work Experience"), entries_html(assets, page, "Work Experience"))
+        + section_html(animation_html(assets, page, "IT Skills"), skills)
+        + f"</main></div><script src='{lottie.LOTTIE_JS}'></script><script>{LOTTIE_INIT}</script></body></html>"
+    )
+
+
+def build(out_dir=OUT_DIR, force=False):
+    """Export the page to ``out_dir`` unless it is already up to date; return a summary."""
+    key = build_key()
+    key_file = os.path.join(out_dir, ".build-key")
+    if not force and os.path.exists(key_file):
+        with open(key_file) as f:
+            if f.read().strip() == key:
+                return {"out": out_dir, "rebuilt": False, "key": key}
+
+    # Start from an empty assets dir so stale hashed files do not pile up.
+    shutil.rmtree(os.path.join(out_dir, "assets"), ignore_errors=True)
+    assets = _Assets(out_dir)
+    with open(os.path.join(out_dir, "index.html"), "w") as f:
+        f.write(render(assets))
+    with open(key_file, "w") as f:
+        f.write(key)
+    size = sum(os.path.getsize(os.path.join(assets.dir, name)) for name in os.listdir(assets.dir))
+    return {"out": out_dir, "rebuilt": True, "key": key, "assets": len(os.listdir(assets.dir)), "bytes": size}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the landing page as static HTML.")
+    parser.add_argument("--out", default=OUT_DIR)
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    args = parser.parse_args()
+    print(json.dumps(build(args.out, args.force), indent=2))
@@ -0,0 +1,153 @@
+"""Width-matched derivatives of the images shown on the landing page.
+
+``image_path`` returns a copy of an image resized to the width it is displayed
+at, generated on first use and cached on disk under ``.cache/images/`` with the
+source content hash in the file name. Pre-build every page image, and print
+the size report, with::
+
+    python -m portfolio.images
+"""
+import hashlib
+import io
+import logging
+import os
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = "./.cache/images"
+DENSITIES = (1, 2)
+FORMATS = ("webp", "fallback")
+# Source formats every browser displays, which can stand in for a derivative.
+WEB_FORMATS = ("PNG", "JPEG", "GIF", "WEBP")
+
+_hashes = {}
+_built = {}
+_lock = threading.Lock()
+
+
+def content_hash(path):
+    """Return a short sha256 of the file, computed once per (path, mtime)."""
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with _lock:
+        digest = _hashes.get(key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:12]
+        with _lock:
+            _hashes[key] = digest
+    return digest
+
+
+def _encode(img, fmt):
+    """Encode ``img`` as WebP, or as optimized PNG (transparency) / JPEG (opaque) for the fallback."""
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        img.save(buffer, "WEBP", quality=82, method=6)
+        return buffer.getvalue(), "webp"
+    if img.mode in ("RGBA", "LA") and img.getchannel("A").getextrema()[0] == 255:
+        img = img.convert("RGB")  # alpha channel with no transparent pixel
+    if img.mode in ("RGBA", "LA", "P"):
+        img.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue(), "png"
+    img.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True, progressive=True)
+    return buffer.getvalue(), "jpg"
+
+
+def derivative(path, width, density=1, fmt="webp"):
+    """Return the path of ``path`` resized to ``width * density`` px, building it if needed.
+
+    Images are never upscaled. The original file is returned instead when it
+    would be as good: a fallback at the original size (nothing to re-encode),
+    or an encoded derivative no smaller than the original. It is also returned
+    if the image cannot be processed, so a broken derivative never hides an
+    image from the page.
+    """
+    try:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        prefix = f"{stem}.{content_hash(path)}.{width}w@{density}x.{fmt}"
+        out = _built.get(prefix)
+        if out and os.path.exists(out):
+            return out
+        if os.path.isdir(CACHE_DIR):
+            for name in os.listdir(CACHE_DIR):
+                if name.startswith(prefix + "."):
+                    _built[prefix] = os.path.join(CACHE_DIR, name)
+                    return _built[prefix]
+
+        from PIL import Image
+
+        with Image.open(path) as img:
+            img.load()
+            servable = img.format in WEB_FORMATS
+            target = min(width * density, img.width)
+            if target < img.width:
+                img = img.resize((target, round(img.height * target / img.width)), Image.LANCZOS)
+            elif servable and fmt == "fallback":
+                _built[prefix] = path
+                return path
+            data, ext = _encode(img, fmt)
+        if servable and len(data) >= os.path.getsize(path):
+            _built[prefix] = path
+            return path
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        out = os.path.join(CACHE_DIR, f"{prefix}.{ext}")
+        tmp = f"{out}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, out)
+        _built[prefix] = out
+        return out
+    except Exception:
+        logger.exception("Could not build derivative of %s, serving the original", path)
+        return path
+
+
+def image_path(path, width):
+    """Image to pass to ``st.image(..., width=width)``: the 1x PNG/JPEG fallback.
+
+    st.image decodes anything wider than ``width``, shrinks it to 1x and
+    re-encodes it as PNG/JPEG on every run, so a 2x or WebP derivative would
+    only add that work. At exactly ``width`` its bytes are sent unchanged;
+    WebP and 2x are left to the ``<picture>`` path (``portfolio.assets``).
+    """
+    return derivative(path, width, density=1, fmt="fallback")
+
+
+def picture_html(webp, fallback, width):
+    """<picture> with WebP and PNG/JPEG srcsets, given one URL per density for each."""
+    srcset = lambda urls: ", ".join(f"{url} {d}x" for url, d in zip(urls, DENSITIES))
+    return (f"<picture><source type='image/webp' srcset='{srcset(webp)}'>"
+            f"<img src='{fallback[0]}' srcset='{srcset(fallback)}' width='{width}' loading='lazy' alt=''>"
+            f"</picture>")
+
+
+def page_images():
+    """Return {path: displayed width} for every image on the landing page."""
+    from portfolio import content
+
+    return content.load().page_images()
+
+
+def build(images=None):
+    """Build every derivative of ``images`` ({path: width}) and return a size report."""
+    report = []
+    for path, width in (images or page_images()).items():
+        row = {"file": path, "width": width, "bytes": os.path.getsize(path)}
+        for density in DENSITIES:
+            for fmt in FORMATS:
+                out = derivative(path, width, density, fmt)
+                row[f"{fmt}@{density}x"] = os.path.getsize(out)
+        report.append(row)
+    return report
+
+
+if __name__ == "__main__":
+    images = dict((arg.rsplit(":", 1)[0], int(arg.rsplit(":", 1)[1])) for arg in sys.argv[1:])
+    columns = [f"{fmt}@{density}x" for density in DENSITIES for fmt in FORMATS]
+    print(f"{'file':<34}{'width':>6}{'original':>10}" + "".join(f"{c:>14}" for c in columns))
+    for row in build(images):
+        print(f"{row['file']:<34}{row['width']:>6}{row['bytes']:>10}"
+              + "".join(f"{row[c]:>14}" for c in columns))
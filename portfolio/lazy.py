@@ -0,0 +1,44 @@
+"""Expanders whose body is only built once the visitor opens them.
+
+Streamlit never tells the server whether an ``st.expander`` is open, so its
+body (images, long markdown) is serialized on every run even when collapsed.
+In lazy mode the expander header is a checkbox styled like an expander, and
+the body function only runs, and is only sent, while it is ticked (the
+header styling lives in ``style/page.css``). Each lazy expander is its own
+``st.fragment``, so ticking one reruns only that entry, not the section with
+every other open body in it::
+
+    @lazy_expander(col2, "Project title")
+    def body():
+        st.markdown(...)
+        st.image(...)
+"""
+import hashlib
+
+import streamlit as st
+
+LAZY_EXPANDERS = True
+
+
+def expander_key(label):
+    return "lazy_" + hashlib.md5(label.encode()).hexdigest()[:8]
+
+
+@st.fragment
+def _lazy(label, key, body):
+    if st.checkbox(label, key=key):
+        body()
+
+
+def lazy_expander(parent, label, key=None):
+    """Decorator rendering the decorated function as the body of an expander in ``parent``."""
+    def render(body):
+        if not LAZY_EXPANDERS:
+            with parent.expander(label):
+                body()
+            return body
+        # Called inside ``parent`` so the fragment's checkbox and body are its own elements.
+        with parent:
+            _lazy(label, key or expander_key(label), body)
+        return body
+    return render
@@ -0,0 +1,185 @@
+"""Concurrent-session load test of the landing page.
+
+Starts Home.py on a local Streamlit server, opens N simulated browser
+sessions over the websocket protocol, runs the page in each, then clicks the
+resume download button in each (a fragment rerun). Records per-session script
+time, the server's RSS and the large byte buffers duplicated across sessions
+(see ``perf.memory_report``) for every N, giving a capacity baseline::
+
+    python -m portfolio.loadtest --sessions 1 10 100 --json loadtest.json
+
+Needs Linux (RSS is read from /proc).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+from portfolio.perf import rss_bytes
+
+SCRIPT = "Home.py"
+FINISHED = (ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+
+
+class Session:
+    """One simulated browser tab."""
+
+    def __init__(self, port):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.page_script_hash = ""
+        self.download_button = None  # (widget id, fragment id)
+
+    async def connect(self):
+        self.conn = await websocket_connect(self.url, subprotocols=["streamlit"])
+
+    async def rerun(self, widget_states=(), fragment_id=""):
+        """Request a (fragment) rerun and return the seconds until the script finished."""
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = ""
+        state.page_script_hash = self.page_script_hash
+        state.widget_states.widgets.extend(widget_states)
+        if fragment_id:
+            state.fragment_id = fragment_id
+        start = time.perf_counter()
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            data = await self.conn.read_message()
+            if data is None:
+                raise ConnectionError("server closed the session")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = fwd.new_session.page_script_hash
+            elif kind == "delta" and fwd.delta.new_element.WhichOneof("type") == "download_button":
+                self.download_button = (fwd.delta.new_element.download_button.id, fwd.delta.fragment_id)
+            elif kind == "script_finished" and fwd.script_finished in FINISHED:
+                return time.perf_counter() - start
+
+    async def click_download(self):
+        widget_id, fragment_id = self.download_button
+        state = WidgetState(id=widget_id, trigger_value=True)
+        return await self.rerun([state], fragment_id)
+
+    def close(self):
+        self.conn.close()
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(script, port, memstats):
+    env = dict(os.environ, PORTFOLIO_MEMSTATS=memstats)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Streamlit server did not start")
+
+
+def _summary(values):
+    values = sorted(values)
+    return {
+        "p50_ms": statistics.median(values) * 1000,
+        "p95_ms": values[min(len(values) - 1, int(len(values) * 0.95))] * 1000,
+        "max_ms": values[-1] * 1000,
+    }
+
+
+async def memory_snapshot(session, memstats):
+    """Ask the server for ``perf.memory_report`` on one extra, unmeasured page run.
+
+    The heap scan takes seconds with many sessions open, so it is kept out of
+    the runs whose latency is reported.
+    """
+    if os.path.exists(memstats):
+        os.remove(memstats)
+    open(memstats + ".request", "w").close()
+    await session.rerun()
+    with open(memstats) as f:
+        return json.load(f)
+
+
+async def run_level(port, n, pid, memstats):
+    """Open ``n`` sessions at once, run the page and a download click in each."""
+    sessions = [Session(port) for _ in range(n)]
+    await asyncio.gather(*(s.connect() for s in sessions))
+    try:
+        first = await asyncio.gather(*(s.rerun() for s in sessions))
+        clicks = await asyncio.gather(*(s.click_download() for s in sessions))
+        memory = await memory_snapshot(sessions[0], memstats)
+        return {
+            "sessions": n,
+            "page_run": _summary(first),
+            "download_rerun": _summary(clicks),
+            "rss": rss_bytes(pid),
+            "duplicated_buffers": memory["duplicated_buffers"],
+            "duplicated_bytes": memory["duplicated_bytes"],
+        }
+    finally:
+        for s in sessions:
+            s.close()
+
+
+async def load_test(levels, script=SCRIPT):
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        memstats = os.path.join(tmp, "memstats.json")
+        proc = start_server(script, port, memstats)
+        try:
+            baseline = rss_bytes(proc.pid)
+            results = []
+            for n in levels:
+                results.append(await run_level(port, n, proc.pid, memstats))
+            return {"baseline_rss": baseline, "levels": results}
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test Home.py with concurrent sessions.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--script", default=SCRIPT)
+    parser.add_argument("--json", help="write the scaling curve to this file")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(load_test(args.sessions, args.script))
+    print(f"baseline RSS {report['baseline_rss'] / 2**20:.0f} MiB")
+    for level in report["levels"]:
+        print(f"{level['sessions']:>4} sessions: page p50 {level['page_run']['p50_ms']:.0f} ms "
+              f"p95 {level['page_run']['p95_ms']:.0f} ms, download p50 {level['download_rerun']['p50_ms']:.0f} ms, "
+              f"RSS {level['rss'] / 2**20:.0f} MiB, {level['duplicated_buffers']} duplicated buffers "
+              f"({level['duplicated_bytes'] / 2**10:.0f} KiB)")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""Lottie animations: shared parse cache and an offline minifier.
+
+``load_lottie`` parses each animation once per process (keyed by path and
+mtime) and prefers the minified copy under ``Images/min/`` when the manifest
+says it was built from the current source. Build the minified copies with::
+
+    python -m portfolio.lottie Images/Dataviz.json Images/Home_work.json Images/Computer.json
+
+``--posters`` rasterizes the first frame the player shows (the last one, as the
+page plays them in reverse) to a small WebP under ``Images/posters/``, named
+after the source hash. It needs the optional python-lottie (SVG export) and
+resvg-py (rasterizer) packages from ``requirements-dev.txt``, and Pillow.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+MIN_DIR = "./Images/min"
+MANIFEST = os.path.join(MIN_DIR, "manifest.json")
+POSTER_DIR = "./Images/posters"
+POSTER_HEIGHT = 800  # 2x the tallest animation on the page
+LOTTIE_JS = "https://cdnjs.cloudflare.com/ajax/libs/lottie-web/5.12.2/lottie.min.js"
+
+# Keys only used by the After Effects exporter and by expressions, which none
+# of the bundled animations use.
+METADATA_KEYS = {"meta", "mn", "nm", "cl", "ln", "ix"}
+# Values the player already assumes when the key is missing.
+DEFAULTS = {"hd": False, "ao": 0, "ddd": 0, "bm": 0, "ef": []}
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def minified_path(path):
+    return os.path.join(MIN_DIR, os.path.basename(path))
+
+
+def _digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _resolve(path):
+    """Return the minified copy of ``path`` if it was built from the current source."""
+    min_path = minified_path(path)
+    try:
+        with open(MANIFEST, "r") as f:
+            built_from = json.load(f).get(os.path.basename(path))
+    except (OSError, ValueError):
+        return path
+    if built_from == _digest(path) and os.path.exists(min_path):
+        return min_path
+    return path
+
+
+def poster_path(path):
+    """Return the poster frame built from the current ``path``, or None if there is none."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    poster = os.path.join(POSTER_DIR, f"{stem}.{_digest(path)[:12]}.webp")
+    return poster if os.path.exists(poster) else None
+
+
+def load_lottie(path):
+    """Return the parsed animation for ``path``, parsing it at most once per version."""
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with _lock:
+        data = _cache.get(key)
+        if data is None:
+            with open(_resolve(path), "r") as file:
+                data = json.load(file)
+            _cache[key] = data
+    return data
+
+
+def _round(value, precision):
+    if isinstance(value, float):
+        value = round(value, precision)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, list):
+        return [_round(v, precision) for v in value]
+    if isinstance(value, dict):
+        return {k: _round(v, precision) for k, v in value.items()}
+    return value
+
+
+def _strip_metadata(value):
+    if isinstance(value, list):
+        return [_strip_metadata(v) for v in value]
+    if isinstance(value, dict):
+        return {
+            k: _strip_metadata(v) for k, v in value.items()
+            if k not in METADATA_KEYS and not (k in DEFAULTS and v == DEFAULTS[k])
+        }
+    return value
+
+
+def _visible_layers(layers, ip, op):
+    """Drop hidden layers and layers that never appear within [ip, op).
+
+    A dropped layer is kept after all when a kept layer is parented to it,
+    directly or up a chain of parents: its transform still moves its children.
+    """
+    kept = [
+        layer for layer in layers
+        if not layer.get("hd") and layer.get("ip", ip) < op and layer.get("op", op) > ip
+    ]
+    by_index = {layer["ind"]: layer for layer in layers if "ind" in layer}
+    needed, pending = set(map(id, kept)), list(kept)
+    while pending:
+        parent = by_index.get(pending.pop().get("parent"))
+        if parent is not None and id(parent) not in needed:
+            needed.add(id(parent))
+            pending.append(parent)
+    return [layer for layer in layers if id(layer) in needed]
+
+
+def minify(data, precision=2):
+    """Return a smaller, render-equivalent copy of a Lottie document."""
+    ip, op = data.get("ip", 0), data.get("op", float("inf"))
+    data = dict(data, layers=_visible_layers(data.get("layers", []), ip, op))
+    assets = {asset["id"]: asset for asset in data.get("assets", []) if "id" in asset}
+
+    # Keep only the assets reachable from the root layers (precomps can nest).
+    used, pending = set(), [data["layers"]]
+    while pending:
+        for layer in pending.pop():
+            ref = layer.get("refId")
+            if ref in assets and ref not in used:
+                used.add(ref)
+                if "layers" in assets[ref]:
+                    pending.append(assets[ref]["layers"])
+    data["assets"] = [asset for asset in data.get("assets", []) if asset.get("id") in used]
+
+    return _round(_strip_metadata(data), precision)
+
+
+def build(paths, precision=2):
+    """Write minified copies of ``paths`` to MIN_DIR and return a size/parse-time report."""
+    os.makedirs(MIN_DIR, exist_ok=True)
+    try:
+        with open(MANIFEST, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    report = []
+    for path in paths:
+        with open(path, "r") as file:
+            raw = file.read()
+        start = time.perf_counter()
+        data = json.loads(raw)
+        parse_before = (time.perf_counter() - start) * 1000
+
+        out = json.dumps(minify(data, precision), separators=(",", ":"))
+        with open(minified_path(path), "w") as file:
+            file.write(out)
+        manifest[os.path.basename(path)] = hashlib.sha256(raw.encode()).hexdigest()
+        start = time.perf_counter()
+        json.loads(out)
+        parse_after = (time.perf_counter() - start) * 1000
+
+        report.append({
+            "file": path,
+            "bytes_before": len(raw.encode()),
+            "bytes_after": len(out.encode()),
+            "parse_ms_before": round(parse_before, 2),
+            "parse_ms_after": round(parse_after, 2),
+        })
+    with open(MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return report
+
+
+def _rasterizer():
+    try:
+        from lottie.exporters.svg import export_svg
+        from lottie.parsers.tgs import parse_tgs
+        from resvg_py import svg_to_bytes
+    except ImportError as exc:
+        raise ImportError(
+            "Poster frames need the optional python-lottie and resvg-py packages: "
+            "pip install -r requirements-dev.txt"
+        ) from exc
+    return parse_tgs, export_svg, svg_to_bytes
+
+
+def build_posters(paths, height=POSTER_HEIGHT, reverse=True):
+    """Rasterize the first displayed frame of each animation to POSTER_DIR; return a report."""
+    parse_tgs, export_svg, svg_to_bytes = _rasterizer()
+    from PIL import Image
+
+    os.makedirs(POSTER_DIR, exist_ok=True)
+    report = []
+    for path in paths:
+        animation = parse_tgs(path)
+        frame = animation.out_point - 1 if reverse else animation.in_point
+        svg = io.BytesIO()
+        export_svg(animation, svg, frame, pretty=False)
+        png = svg_to_bytes(svg_string=svg.getvalue().decode(), height=height)
+        img = Image.open(io.BytesIO(png))
+
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for old in os.listdir(POSTER_DIR):
+            if old.startswith(stem + "."):
+                os.remove(os.path.join(POSTER_DIR, old))
+        poster = os.path.join(POSTER_DIR, f"{stem}.{_digest(path)[:12]}.webp")
+        img.save(poster, "WEBP", quality=70, method=6)
+        report.append({"file": path, "poster": poster, "frame": frame, "size": img.size,
+                       "bytes": os.path.getsize(poster)})
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Minify Lottie animations or build their poster frames.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--precision", type=int, default=2)
+    parser.add_argument("--posters", action="store_true", help="rasterize poster frames instead of minifying")
+    args = parser.parse_args(argv)
+
+    if args.posters:
+        for row in build_posters(args.paths):
+            print(f"{row['file']:<30}{row['poster']:<50}{row['size'][0]}x{row['size'][1]}"
+                  f"{row['bytes']:>8} bytes (frame {row['frame']:g})")
+        return
+    rows = build(args.paths, args.precision)
+    print(f"{'file':<30}{'before':>10}{'after':>10}{'saved':>8}{'parse ms':>18}")
+    for row in rows:
+        saved = 1 - row["bytes_after"] / row["bytes_before"]
+        print(f"{row['file']:<30}{row['bytes_before']:>10}{row['bytes_after']:>10}{saved:>8.0%}"
+              f"{row['parse_ms_before']:>9} -> {row['parse_ms_after']:<6}")
+
+
+if __name__ == "__main__":
+    main()
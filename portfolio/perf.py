@@ -0,0 +1,174 @@
+"""Render profiling for the landing page.
+
+Times the page and each section, with optional named steps inside a section
+(the resume fetch, the portrait, ...), and counts the elements and bytes sent
+to the frontend while each one ran. Records are kept in memory for the process
+and can be exported as JSON; set ``PORTFOLIO_PROFILE=/path/file.jsonl`` to
+also append each record to a file as it is taken.
+
+``memory_report`` gives the process RSS and the large byte buffers alive in
+it, grouped by content to spot per-session copies of the same data. It scans
+the whole heap, so it is only taken on request: with
+``PORTFOLIO_MEMSTATS=/path/file.json`` set, the first page run to end after
+``/path/file.json.request`` is created writes it and deletes the request (used
+by ``portfolio.loadtest`` once per level, outside the measured runs).
+"""
+import contextlib
+import gc
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+MAX_RECORDS = 1000
+
+_records = deque(maxlen=MAX_RECORDS)
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class _Counter:
+    """Wraps a ScriptRunContext's enqueue to tally the messages it sends."""
+
+    def __init__(self, enqueue):
+        self.enqueue = enqueue
+        self.elements = 0
+        self.bytes = 0
+
+    def __call__(self, msg):
+        if msg.HasField("delta"):
+            self.elements += 1
+        self.bytes += msg.ByteSize()
+        self.enqueue(msg)
+
+
+def _counter():
+    """Return the counter installed on the current script run, installing it once."""
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    if not isinstance(ctx._enqueue, _Counter):
+        ctx._enqueue = _Counter(ctx._enqueue)
+    return ctx._enqueue
+
+
+def _snapshot(counter):
+    return (counter.elements, counter.bytes) if counter else (0, 0)
+
+
+def _record(record):
+    with _lock:
+        _records.append(record)
+    path = os.environ.get("PORTFOLIO_PROFILE")
+    if path:
+        with _lock, open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+@contextlib.contextmanager
+def measure(name, kind="section"):
+    """Time the block and count what it sent to the frontend."""
+    counter = _counter()
+    elements, size = _snapshot(counter)
+    record = {"name": name, "kind": kind, "started": time.time(), "steps": {}}
+    stack = _local.__dict__.setdefault("stack", [])
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["ms"] = (time.perf_counter() - start) * 1000
+        after_elements, after_size = _snapshot(counter)
+        record["elements"] = after_elements - elements
+        record["bytes"] = after_size - size
+        stack.pop()
+        _record(record)
+
+
+@contextlib.contextmanager
+def step(name):
+    """Time a named step inside the enclosing ``measure`` block."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stack = getattr(_local, "stack", None)
+        if stack:
+            steps = stack[-1]["steps"]
+            steps[name] = steps.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def begin_page():
+    """Start measuring a full page run; pair with ``end_page`` at the bottom of Home.py."""
+    # Drop anything left open by a previous run that raised.
+    _local.stack = []
+    _local.page = measure("page", kind="page")
+    _local.page.__enter__()
+
+
+def end_page():
+    page = getattr(_local, "page", None)
+    if page is not None:
+        _local.page = None
+        page.__exit__(None, None, None)
+    path = os.environ.get("PORTFOLIO_MEMSTATS")
+    if path:
+        try:
+            os.remove(path + ".request")
+        except FileNotFoundError:
+            return
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(memory_report(), f)
+        os.replace(tmp, path)
+
+
+def rss_bytes(pid="self"):
+    """Resident set size of a process (Linux /proc)."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def memory_report(min_size=64 * 1024):
+    """RSS plus the bytes/bytearray buffers of at least ``min_size`` bytes, with duplicates.
+
+    Byte strings are not tracked by the garbage collector, so they are found
+    through the containers that reference them.
+    """
+    groups, seen = {}, set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, (bytes, bytearray)) and len(ref) >= min_size and id(ref) not in seen:
+                seen.add(id(ref))
+                digest = hashlib.sha1(ref).hexdigest()
+                groups.setdefault(digest, []).append(len(ref))
+    duplicated = [sizes for sizes in groups.values() if len(sizes) > 1]
+    return {
+        "rss": rss_bytes(),
+        "buffers": len(seen),
+        "buffer_bytes": sum(sum(sizes) for sizes in groups.values()),
+        "duplicated_buffers": sum(len(sizes) - 1 for sizes in duplicated),
+        "duplicated_bytes": sum(sum(sizes[1:]) for sizes in duplicated),
+    }
+
+
+def records(kind=None):
+    """Return the recorded measurements, oldest first, optionally filtered by kind."""
+    with _lock:
+        return [dict(r) for r in _records if kind is None or r["kind"] == kind]
+
+
+def export_json(path=None):
+    """Return all records as JSON, writing them to ``path`` when given."""
+    data = json.dumps(records(), indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(data)
+    return data
@@ -0,0 +1,171 @@
+"""Poster-first Lottie player.
+
+``st_lottie`` starts every animation as soon as the page loads and keeps it
+looping at full quality, visible or not. ``render`` embeds a small lottie-web
+player instead, which:
+
+* shows the poster frame (``python -m portfolio.lottie --posters ...``) and
+  only loads the animation once it scrolls into view and the browser is idle,
+  pausing it again when it leaves the viewport;
+* with ``prefers-reduced-motion`` set, keeps the poster (or the first frame
+  when there is no poster) and never plays;
+* starts in low quality (whole frames only, no sub-frame interpolation) on
+  devices with few cores, little memory or Save-Data on, and steps down at
+  runtime when the measured frame time is too high: first to low quality,
+  then back to the still poster.
+
+Frame times are measured in the browser with requestAnimationFrame while the
+animation plays. With ``?debug=1`` they are shown under each animation (p50/p95
+per 120 frames), and ``?lottie_quality=high|low`` pins the quality to compare
+both.
+
+lottie-web itself is loaded from cdnjs (LOTTIE_JS), a third-party runtime
+dependency st_lottie did not have: Streamlit's ``app/static`` route serves
+``.js`` as ``text/plain`` with ``nosniff``, which browsers refuse to execute.
+When the script cannot be loaded (blocked, offline), the player keeps the
+poster. The animation JSON is inlined (Streamlit would serve a static .json as
+text/plain); the poster comes from the static assets when it is published
+(``portfolio.assets``), and is inlined otherwise.
+"""
+import base64
+import json
+import os
+import threading
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from portfolio import assets
+from portfolio.lottie import LOTTIE_JS, load_lottie, poster_path
+
+POSTER_FIRST = True
+SLOW_FRAME_MS = 25  # p95 frame time above which the player steps down
+DEBUG_HEIGHT = 24
+
+_html = {}
+_lock = threading.Lock()
+
+PLAYER_JS = """
+(function () {
+  var cfg = CONFIG;
+  var poster = document.getElementById("poster");
+  var stats = document.getElementById("stats");
+  var reduced = window.matchMedia("(prefers-reduced-motion: reduce)").matches;
+  var conn = navigator.connection || {};
+  var slowDevice = (navigator.hardwareConcurrency || 8) <= 4 || (navigator.deviceMemory || 8) <= 4 || conn.saveData;
+  var quality = cfg.quality || (slowDevice ? "low" : "high");
+  var anim = null, visible = false, frames = [], last = 0;
+
+  function show(still) { if (poster) poster.style.display = still ? "" : "none"; }
+
+  function play() {
+    if (!anim || !anim.isLoaded || !visible || reduced || quality === "poster" || !anim.isPaused) return;
+    show(false);
+    anim.play();
+    last = 0;
+    requestAnimationFrame(tick);
+  }
+
+  function load() {
+    var options = {container: document.getElementById("anim"), renderer: "svg", loop: true, autoplay: false,
+                   rendererSettings: {progressiveLoad: true}};
+    options.animationData = cfg.data;
+    anim = lottie.loadAnimation(options);
+    anim.setSpeed(cfg.speed);
+    anim.setDirection(-1);
+    anim.setSubframe(quality === "high");
+    anim.addEventListener("DOMLoaded", function () {
+      if (reduced) { anim.goToAndStop(anim.totalFrames - 1, true); show(false); }
+      else play();
+    });
+  }
+
+  function tick(now) {
+    if (!anim || anim.isPaused) return;
+    if (last) record(now - last);
+    last = now;
+    requestAnimationFrame(tick);
+  }
+
+  function record(ms) {
+    frames.push(ms);
+    if (frames.length < 120) return;
+    frames.sort(function (a, b) { return a - b; });
+    var p50 = frames[60], p95 = frames[114];
+    frames = [];
+    if (stats) stats.textContent = quality + ": " + p50.toFixed(1) + " ms/frame p50, " + p95.toFixed(1) + " ms p95";
+    if (p95 > cfg.slowFrameMs && !cfg.quality) stepDown();
+  }
+
+  function stepDown() {
+    if (quality === "high") { quality = "low"; anim.setSubframe(false); return; }
+    quality = "poster";
+    anim.pause();
+    if (poster) show(true);
+  }
+
+  function start() {
+    if (anim) return play();
+    if (reduced && poster) return;
+    if (typeof lottie === "undefined") return;  // lottie-web did not load: keep the poster
+    if (window.requestIdleCallback) window.requestIdleCallback(load, {timeout: 1500});
+    else setTimeout(load, 200);
+  }
+
+  if (!("IntersectionObserver" in window)) { visible = true; return start(); }
+  new IntersectionObserver(function (changes) {
+    visible = changes[changes.length - 1].isIntersecting;
+    if (visible) start(); else if (anim && !anim.isPaused) anim.pause();
+  }).observe(document.getElementById("stage"));
+})();
+"""
+
+
+def _inline_poster(path):
+    poster = poster_path(path)
+    if poster is None:
+        return None
+    with open(poster, "rb") as f:
+        return "data:image/webp;base64," + base64.b64encode(f.read()).decode()
+
+
+def player_html(settings, debug=False, quality=None):
+    """The player document for one animation of content.json, built once per version."""
+    path = settings["path"]
+    poster = assets.asset_url(assets.poster_key(path))
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns, poster,
+           settings["height"], settings["speed"], debug, quality)
+    with _lock:
+        html = _html.get(key)
+    if html is not None:
+        return html
+
+    config = {"speed": settings["speed"], "quality": quality, "slowFrameMs": SLOW_FRAME_MS,
+              "data": load_lottie(path)}
+    poster = poster or _inline_poster(path)
+    height = settings["height"]
+    html = (
+        "<style>body{margin:0;overflow:hidden}"
+        "#stage,#anim,#poster{height:%dpx;width:100%%}#stage{position:relative}"
+        "#anim,#poster{position:absolute;top:0;left:0;object-fit:contain}"
+        "#stats{font:12px sans-serif;color:#808495}</style>" % height
+        + "<div id='stage'><div id='anim'></div>"
+        + (f"<img id='poster' src='{poster}' alt=''>" if poster else "")
+        + "</div>"
+        + ("<div id='stats'></div>" if debug else "")
+        + f"<script src='{LOTTIE_JS}'></script>"
+        + "<script>" + PLAYER_JS.replace("CONFIG", json.dumps(config).replace("</", "<\\/")) + "</script>"
+    )
+    with _lock:
+        _html[key] = html
+    return html
+
+
+def render(settings):
+    """Embed the poster-first player for ``settings`` (an entry of ``content.load().animations``)."""
+    debug = bool(st.query_params.get("debug"))
+    quality = st.query_params.get("lottie_quality")
+    if quality not in ("high", "low"):
+        quality = None
+    components.html(player_html(settings, debug, quality),
+                    height=settings["height"] + (DEBUG_HEIGHT if debug else 0))
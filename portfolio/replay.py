@@ -0,0 +1,132 @@
+"""Local stand-in for the remote APIs, replaying recorded responses.
+
+A fixture is one JSON file holding the request path and query, the status,
+headers and body of a response. ``ApiClient(record_dir=...)`` records them
+from the real APIs; ``serve()`` replays them over HTTP, answering
+If-None-Match with 304 and optionally adding latency, so the client can be
+tested and benchmarked offline::
+
+    server, base_url = serve("fixtures/api", latency=0.05)
+    client = ApiClient(base_url)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+def request_key(path, query):
+    """Fixture key for a request: the path plus its query parameters in sorted order."""
+    query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return hashlib.sha256(f"{path}?{query}".encode()).hexdigest()[:24]
+
+
+def save(fixtures_dir, path, query, body, status=200, headers=None):
+    os.makedirs(fixtures_dir, exist_ok=True)
+    fixture = {"path": path, "query": query, "status": status, "headers": headers or {}, "body": body}
+    with open(os.path.join(fixtures_dir, request_key(path, query) + ".json"), "w") as f:
+        json.dump(fixture, f)
+
+
+def _template(value, base_url):
+    """``value`` with every string starting with ``base_url`` rebased on ``{base_url}``."""
+    if isinstance(value, dict):
+        return {key: _template(item, base_url) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_template(item, base_url) for item in value]
+    if isinstance(value, str) and value.startswith(base_url):
+        return "{base_url}" + value[len(base_url):]
+    return value
+
+
+def record(fixtures_dir, response, base_url=None):
+    """Save a live ``requests`` response as a fixture.
+
+    Links under ``base_url`` (the client's, e.g. OData's ``@odata.nextLink``)
+    are saved as ``{base_url}...`` so that replay follows them to the local
+    server, not the live API.
+    """
+    url = urlsplit(response.url)
+    headers = {name: response.headers[name] for name in ("ETag", "Last-Modified") if name in response.headers}
+    body = response.json()
+    if base_url:
+        body = _template(body, base_url)
+    save(fixtures_dir, url.path, url.query, body, response.status_code, headers)
+
+
+def load(fixtures_dir):
+    fixtures = {}
+    for name in os.listdir(fixtures_dir):
+        if name.endswith(".json"):
+            with open(os.path.join(fixtures_dir, name)) as f:
+                fixture = json.load(f)
+            fixtures[request_key(fixture["path"], fixture["query"])] = fixture
+    return fixtures
+
+
+def serve(fixtures_dir, host="127.0.0.1", port=0, latency=0.0):
+    """Serve the fixtures from a background thread; return (server, base_url).
+
+    Paths are matched relative to the base URL, so a fixture recorded as
+    ``/api/Indicator`` is served at ``<base_url>Indicator`` as well. Stop
+    with ``server.shutdown()``.
+    """
+    fixtures = load(fixtures_dir)
+    by_suffix = {}
+    for fixture in fixtures.values():
+        name = fixture["path"].rstrip("/").rsplit("/", 1)[-1]
+        by_suffix.setdefault(request_key("/" + name, fixture["query"]), fixture)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            url = urlsplit(self.path)
+            fixture = fixtures.get(request_key(url.path, url.query)) or by_suffix.get(request_key(url.path, url.query))
+            if fixture is None:
+                self._send(404, {}, b'{"error": "no fixture"}')
+                return
+            body = json.dumps(fixture["body"]).replace("{base_url}", base_url).encode()
+            etag = fixture["headers"].get("ETag") or '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, {"ETag": etag}, b"")
+                return
+            self._send(fixture["status"], dict(fixture["headers"], ETag=etag), body)
+
+        def _send(self, status, headers, body):
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    base_url = f"http://{host}:{server.server_address[1]}/"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, base_url
+
+
+def synthetic_fixtures(fixtures_dir, endpoints=50, pages=3, rows=100):
+    """Write WHO-style paginated OData fixtures ``/Indicator<i>`` for benchmarks.
+
+    ``{base_url}`` in a body is replaced by the server's URL when served.
+    """
+    for i in range(endpoints):
+        for page in range(pages):
+            query = "" if page == 0 else f"$skip={page * rows}"
+            body = {"value": [{"IndicatorCode": f"IND{i}", "SpatialDim": f"C{j}", "NumericValue": j * 0.5}
+                              for j in range(page * rows, (page + 1) * rows)]}
+            if page + 1 < pages:
+                body["@odata.nextLink"] = f"{{base_url}}Indicator{i}?$skip={(page + 1) * rows}"
+            save(fixtures_dir, f"/Indicator{i}", query, body)
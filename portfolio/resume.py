@@ -0,0 +1,116 @@
+"""Process-wide source for the resume PDF offered by the header download button.
+
+The bytes are served from memory. The first request reads the copy committed
+under ``Images/``; the GitHub copy is then revalidated in a background thread
+(ETag / If-Modified-Since, hard timeout) so a slow or offline GitHub never
+blocks the page.
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+RESUME_PATH = "./Images/2025 - Resume Adrien Debruge.pdf"
+RESUME_URL = "https://raw.githubusercontent.com/AdrienDBe/streamlit_app/main/Images/2025%20-%20Resume%20Adrien%20Debruge.pdf"
+
+
+class ResumeProvider:
+    """Serve the resume bytes from a shared cache, refreshed in the background."""
+
+    def __init__(self, path, url, max_age=3600, timeout=5):
+        self.path = path
+        self.url = url
+        self.max_age = max_age
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._content = None
+        self._etag = None
+        self._last_modified = None
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._stats = {
+            name: {"count": 0, "total_ms": 0.0, "last_ms": 0.0}
+            for name in ("hit", "miss", "refresh", "refresh_error")
+        }
+
+    def get(self):
+        """Return the resume bytes, starting a background revalidation when stale."""
+        start = time.perf_counter()
+        with self._lock:
+            if self._content is None:
+                self._content = self._load_initial()
+                self._record("miss", start)
+            else:
+                self._record("hit", start)
+            content = self._content
+            if not self._refreshing and time.time() - self._checked_at > self.max_age:
+                self._refreshing = True
+                threading.Thread(target=self._revalidate, daemon=True).start()
+        return content
+
+    def stats(self):
+        """Return a copy of the hit/miss/refresh counters and timings (ms)."""
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
+
+    def _load_initial(self):
+        try:
+            with open(self.path, "rb") as f:
+                return f.read()
+        except OSError:
+            logger.warning("Local resume %s missing, fetching %s", self.path, self.url)
+        # No local copy: this is the only blocking fetch, and it is still bounded.
+        import requests
+
+        response = requests.get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        self._store(response)
+        return response.content
+
+    def _revalidate(self):
+        # Imported here so the landing page does not pay for requests at startup.
+        import requests
+
+        start = time.perf_counter()
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        try:
+            response = requests.get(self.url, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException as exc:
+            logger.info("Resume revalidation failed, keeping cached copy: %s", exc)
+            with self._lock:
+                self._checked_at = time.time()
+                self._refreshing = False
+                self._record("refresh_error", start)
+            return
+        with self._lock:
+            if response.status_code == 200 and response.content:
+                self._content = response.content
+            self._store(response)
+            self._checked_at = time.time()
+            self._refreshing = False
+            self._record("refresh", start)
+        logger.debug("Resume revalidated (%s) in %.1f ms", response.status_code,
+                     self._stats["refresh"]["last_ms"])
+
+    def _store(self, response):
+        self._etag = response.headers.get("ETag", self._etag)
+        self._last_modified = response.headers.get("Last-Modified", self._last_modified)
+
+    def _record(self, name, start):
+        elapsed = (time.perf_counter() - start) * 1000
+        entry = self._stats[name]
+        entry["count"] += 1
+        entry["total_ms"] += elapsed
+        entry["last_ms"] = elapsed
+
+
+# Module-level instance: imported modules outlive script reruns, so every
+# session and rerun in the process shares this cache.
+resume = ResumeProvider(RESUME_PATH, RESUME_URL)
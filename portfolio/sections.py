@@ -0,0 +1,48 @@
+"""Independently re-runnable page sections and a per-rerun work counter.
+
+Each landing-page section is an ``st.fragment``: a widget interaction (the
+resume download button) only re-executes the section that owns the widget
+instead of the whole of Home.py; a lazy expander is a fragment of its own
+inside the section (``portfolio.lazy``) and only re-executes its entry. Every execution is counted in
+``st.session_state``; open the page with ``?debug=1`` to show the counts
+under each section. Sections are also timed by ``portfolio.perf``.
+"""
+import functools
+import logging
+
+import streamlit as st
+
+from portfolio import perf
+
+logger = logging.getLogger(__name__)
+
+COUNTER_KEY = "_section_runs"
+
+
+def count_page_run():
+    """Record a full execution of the page script; call once at the top of Home.py."""
+    counts = st.session_state.setdefault(COUNTER_KEY, {})
+    counts["page"] = counts.get("page", 0) + 1
+
+
+def rerun_counts():
+    """Return {"page": n, "<section>": n, ...} for the current session."""
+    return dict(st.session_state.get(COUNTER_KEY, {}))
+
+
+def section(name):
+    """Decorator turning a page section into a fragment that counts its executions."""
+    def decorate(func):
+        @st.fragment
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            counts = st.session_state.setdefault(COUNTER_KEY, {})
+            counts[name] = counts.get(name, 0) + 1
+            logger.debug("section %s run #%d", name, counts[name])
+            with perf.measure(name):
+                result = func(*args, **kwargs)
+            if st.query_params.get("debug"):
+                st.caption(f"{name}: {counts[name]} runs, page: {counts.get('page', 0)} runs")
+            return result
+        return run
+    return decorate
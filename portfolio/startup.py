@@ -0,0 +1,90 @@
+"""Import-time report and cold-start budget for the landing page.
+
+Imports the modules Home.py imports in a fresh interpreter with
+``-X importtime``, reports the slowest imports, checks that none of the heavy
+libraries only other sections need (scikit-learn, matplotlib, ...) was pulled
+in beyond what ``import streamlit`` loads by itself, and fails when the total
+is over budget::
+
+    python -m portfolio.startup --budget-ms 2000 --top 15
+"""
+import argparse
+import ast
+import subprocess
+import sys
+
+SCRIPT = "Home.py"
+
+# Only needed by the clustering / profiling / API tools, never by the landing page.
+DEFERRED = ("sklearn", "matplotlib", "seaborn", "missingno", "kneed", "wbgapi", "plotly", "pyarrow")
+
+
+def page_imports(script=SCRIPT):
+    """The top-level import statements of ``script``, in order."""
+    with open(script, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def import_times(statements):
+    """Run ``statements`` in a fresh interpreter; return [(module, self us, cumulative us)].
+
+    Nested imports keep the indentation ``-X importtime`` gives them.
+    """
+    code = "\n".join(statements)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    if out.returncode:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _packages(rows):
+    return {name.strip().split(".")[0] for name, _, _ in rows}
+
+
+def report(script=SCRIPT):
+    rows = import_times(page_imports(script))
+    # Top-level entries (no leading indent) add up to the whole import time.
+    total_us = sum(cumulative for name, _, cumulative in rows if not name.startswith(" "))
+    # Streamlit itself imports some of them (plotly for its chart theme): the
+    # page cannot avoid those, so only what it adds on top is flagged.
+    baseline = _packages(import_times(["import streamlit"]))
+    return {
+        "total_ms": total_us / 1000,
+        "modules": sorted(rows, key=lambda row: row[2], reverse=True),
+        "deferred_loaded": sorted(_packages(rows).intersection(DEFERRED) - baseline),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time report of the landing page.")
+    parser.add_argument("--script", default=SCRIPT)
+    parser.add_argument("--budget-ms", type=float, help="fail when imports take longer than this")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    result = report(args.script)
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for name, self_us, cumulative_us in result["modules"][:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {name}")
+    print(f"total {result['total_ms']:.0f} ms")
+
+    failed = False
+    if result["deferred_loaded"]:
+        print(f"heavy modules imported at startup: {', '.join(result['deferred_loaded'])}", file=sys.stderr)
+        failed = True
+    if args.budget_ms is not None and result["total_ms"] > args.budget_ms:
+        print(f"startup imports take {result['total_ms']:.0f} ms, budget is {args.budget_ms:.0f} ms",
+              file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
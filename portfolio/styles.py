@@ -0,0 +1,88 @@
+"""One deduplicated, minified stylesheet for the whole page.
+
+The page styles live in ``style/`` and are bundled once per process (rebuilt
+only when a file changes), then injected as a single ``<style>`` block on full
+page runs; fragment reruns do not touch it. ``python -m portfolio.styles``
+writes the bundle to ``style/dist/`` under its content hash for render targets
+outside Streamlit.
+"""
+import hashlib
+import os
+import re
+import threading
+
+STYLE_FILES = ("./style/style.css", "./style/wave.css", "./style/page.css")
+DIST_DIR = "./style/dist"
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def minify(css):
+    """Strip comments and whitespace that do not change how the CSS applies."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def split_rules(css):
+    """Split minified CSS into top-level blocks (rules or whole @-blocks)."""
+    rules, depth, start = [], 0, 0
+    for i, char in enumerate(css):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+    return rules
+
+
+def bundle_css(css_texts):
+    """Minify and concatenate ``css_texts``, keeping the last copy of duplicated rules."""
+    rules = [rule for css in css_texts for rule in split_rules(minify(css))]
+    seen, kept = set(), []
+    # A repeated rule keeps its last position so the cascade is unchanged.
+    for rule in reversed(rules):
+        if rule not in seen:
+            seen.add(rule)
+            kept.append(rule)
+    return "".join(reversed(kept))
+
+
+def bundle(files=STYLE_FILES):
+    """Return (css, sha256 prefix) for ``files``, built once per version of the files."""
+    key = tuple((path, os.stat(path).st_mtime_ns) for path in files)
+    with _lock:
+        if key not in _cache:
+            texts = []
+            for path in files:
+                with open(path) as f:
+                    texts.append(f.read())
+            css = bundle_css(texts)
+            _cache[key] = (css, hashlib.sha256(css.encode()).hexdigest()[:12])
+        return _cache[key]
+
+
+def style_tag():
+    """The bundled stylesheet as one ``<style>`` block for ``st.markdown``."""
+    return f"<style>{bundle()[0]}</style>"
+
+
+def write_bundle():
+    """Write the bundle to DIST_DIR as bundle.<hash>.css and return its path."""
+    css, digest = bundle()
+    os.makedirs(DIST_DIR, exist_ok=True)
+    path = os.path.join(DIST_DIR, f"bundle.{digest}.css")
+    with open(path, "w") as f:
+        f.write(css)
+    return path
+
+
+if __name__ == "__main__":
+    raw = sum(os.path.getsize(path) for path in STYLE_FILES)
+    path = write_bundle()
+    print(f"{path}: {raw} -> {os.path.getsize(path)} bytes")
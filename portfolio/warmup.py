@@ -0,0 +1,150 @@
+"""Concurrent warm-up of the deployed apps, with latency history.
+
+Requests every app listed in the sidebar (``content.json``) at once with
+asyncio, records connect time, time-to-first-byte and total time, and
+classifies each app as warm, cold (slow first byte) or asleep (Streamlit
+Cloud's sleep page). Results are appended to a JSON history file::
+
+    python -m portfolio.warmup --history warmup-history/history.json
+
+Only the standard library is used, so it runs without installing the app's
+requirements. Any http(s) URL can be passed instead of the sidebar list, e.g.
+local stand-in servers.
+"""
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlsplit
+
+from portfolio import content
+
+TIMEOUT = 60
+COLD_TTFB = 3.0
+MAX_REDIRECTS = 3
+HISTORY_LIMIT = 1000
+MAX_BODY = 1 << 20  # bytes of the page searched for the sleep markers
+SLEEP_MARKERS = (b"gone to sleep", b"get this app back up")
+
+
+async def _get(url, timeout):
+    """One GET; return (status, location, connect s, ttfb s, body).
+
+    The body is read to the end of the response (Content-Length, or the server
+    closing the connection) but no further than MAX_BODY bytes.
+    """
+    parts = urlsplit(url)
+    https = parts.scheme == "https"
+    port = parts.port or (443 if https else 80)
+    start = time.perf_counter()
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, port, ssl=ssl.create_default_context() if https else None),
+        timeout,
+    )
+    connected = time.perf_counter()
+    try:
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\nUser-Agent: portfolio-warmup\r\n"
+                     f"Accept: text/html\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        first_byte = time.perf_counter()
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = headers.get("content-length", "")
+        limit = min(int(length), MAX_BODY) if length.isdigit() else MAX_BODY
+        blocks, size = [], 0
+        while size < limit:
+            block = await asyncio.wait_for(reader.read(limit - size), timeout)
+            if not block:
+                break
+            blocks.append(block)
+            size += len(block)
+        body = b"".join(blocks)
+    finally:
+        writer.close()
+    status = int(status_line.split()[1])
+    return status, headers.get("location"), connected - start, first_byte - connected, body
+
+
+async def probe(url, timeout=TIMEOUT):
+    """Request ``url`` (following redirects) and return its latency record.
+
+    ``connect`` and ``ttfb`` are those of the final response, the one the app
+    itself serves (``*.streamlit.app`` answers with a redirect first); every
+    hop is kept in ``hops``.
+    """
+    record = {"url": url, "hops": []}
+    start = time.perf_counter()
+    try:
+        target = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, location, connect, ttfb, body = await _get(target, timeout)
+            record["hops"].append({"url": target, "status_code": status, "connect": connect, "ttfb": ttfb})
+            record.update(connect=connect, ttfb=ttfb)
+            if status in (301, 302, 303, 307, 308) and location:
+                target = urljoin(target, location)
+                continue
+            break
+        record["status_code"] = status
+        record["total"] = time.perf_counter() - start
+        if any(marker in body for marker in SLEEP_MARKERS):
+            record["state"] = "asleep"
+        elif status >= 400:
+            record["state"] = "error"
+        else:
+            record["state"] = "cold" if record["ttfb"] >= COLD_TTFB else "warm"
+    except (OSError, asyncio.TimeoutError, ValueError, IndexError) as exc:
+        record.update(state="unreachable", error=f"{type(exc).__name__}: {exc}",
+                      total=time.perf_counter() - start)
+    return record
+
+
+async def warm(urls, timeout=TIMEOUT):
+    return await asyncio.gather(*(probe(url, timeout) for url in urls))
+
+
+def sidebar_urls():
+    return [app["url"] for app in content.load().apps]
+
+
+def append_history(path, results):
+    try:
+        with open(path) as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        history = []
+    history.append({"at": datetime.now(timezone.utc).isoformat(timespec="seconds"), "results": results})
+    history = history[-HISTORY_LIMIT:]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm up the deployed apps and record their latency.")
+    parser.add_argument("urls", nargs="*", help="defaults to the apps listed in the sidebar")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    parser.add_argument("--history", help="append the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(warm(args.urls or sidebar_urls(), args.timeout))
+    for r in results:
+        ttfb = f"{r['ttfb'] * 1000:8.0f} ms" if "ttfb" in r else " " * 11
+        print(f"{r['state']:>11} {ttfb}  {r['url']}")
+    if args.history:
+        append_history(args.history, results)
+    return 0 if all(r["state"] in ("warm", "cold") for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())